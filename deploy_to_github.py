@@ -7,7 +7,7 @@ This script:
 2. Shows a file upload button for the project ZIP
 3. Extracts the ZIP
 4. Creates a GitHub repo via the API
-5. Pushes all files to the repo
+5. Pushes all files to the repo as a single commit (Git Data API)
 
 HOW TO USE:
 -----------
@@ -29,25 +29,32 @@ BRANCH          = "main"
 
 # ─────────────────────────────────────────────────────────────────────────────
 
+import importlib.util
 import subprocess
 import sys
 import os
 
 def install_deps():
-    """Install required Python packages."""
-    packages = ["requests", "ipywidgets"]
-    for pkg in packages:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", pkg, "-q"])
+    """Install required Python packages that aren't already importable."""
+    packages = ["httpx", "h2", "ipywidgets"]
+    missing = [pkg for pkg in packages if importlib.util.find_spec(pkg) is None]
+    if missing:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "-q", *missing])
+        importlib.invalidate_caches()   # find_spec cached the pre-install state
 
 install_deps()
 
 import zipfile
 import base64
+import io
+import hashlib
 import json
 import time
 import tempfile
 import shutil
-import requests
+import threading
+import httpx
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Check if running in Colab
@@ -83,26 +90,93 @@ def github_headers():
         "Content-Type": "application/json",
     }
 
+# One HTTP/2 client shared by every API call (and upload thread) — concurrent
+# requests are multiplexed over a few connections, so TLS is paid once
+CLIENT = httpx.Client(
+    timeout=30.0,
+    transport=httpx.HTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+        retries=3,   # connection-level retries; 5xx is handled in api_request
+    ),
+)
+
+UPLOAD_WORKERS = 16
+RETRY_STATUSES = {502, 503, 504}
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 0.3
+RATE_LIMIT_FLOOR = 50   # back off when fewer API calls than this remain
+SECONDARY_LIMIT_WAIT = 60   # GitHub's advice when a secondary limit gives no hint
+
+def until_reset(resp):
+    """Seconds until the rate-limit window in `resp` resets."""
+    return max(0, int(resp.headers.get("X-RateLimit-Reset", "0")) - time.time())
+
+_throttle_lock = threading.Lock()
+_throttle_until = 0.0
+
+def throttle(wait, reason):
+    """Sleep `wait` seconds, announcing it once per window across all threads."""
+    global _throttle_until
+    wake = time.time() + wait
+    with _throttle_lock:
+        if wait >= 1 and wake > _throttle_until + 1:
+            _throttle_until = wake
+            print(f"\n   ⏳ {reason} — waiting {wait:.0f}s")
+    time.sleep(wait)
+
+def respect_rate_limit(resp):
+    """Sleep until the rate-limit window resets if we're nearly out of calls."""
+    remaining = int(resp.headers.get("X-RateLimit-Remaining", "5000"))
+    if remaining < RATE_LIMIT_FLOOR:
+        throttle(until_reset(resp), f"Rate limit low ({remaining} left)")
+
+def rate_limited_wait(resp):
+    """Seconds to wait if `resp` was rejected by a rate limit, else None."""
+    if resp.status_code not in (403, 429):
+        return None
+    if "Retry-After" in resp.headers:
+        return int(resp.headers["Retry-After"])
+    if resp.headers.get("X-RateLimit-Remaining") == "0":
+        return until_reset(resp)
+    if "secondary rate limit" in resp.text.lower():
+        return SECONDARY_LIMIT_WAIT
+    return None
+
+def api_request(method, url, data=None, body=None):
+    """Send JSON `data` or a raw `body`, retrying transient errors and rate limits."""
+    for attempt in range(RETRY_ATTEMPTS + 1):
+        try:
+            resp = CLIENT.request(method, url, headers=github_headers(), json=data, content=body)
+        except httpx.HTTPError:
+            if attempt == RETRY_ATTEMPTS:
+                raise
+        else:
+            wait = rate_limited_wait(resp)
+            if attempt == RETRY_ATTEMPTS or (wait is None and resp.status_code not in RETRY_STATUSES):
+                return resp
+            if wait is not None:
+                throttle(wait, f"Rate limited ({resp.status_code})")
+                continue
+        time.sleep(RETRY_BACKOFF * 2 ** attempt)
+
 def api_get(url):
-    return requests.get(url, headers=github_headers())
+    return api_request("GET", url)
 
 def api_post(url, data):
-    return requests.post(url, headers=github_headers(), json=data)
+    return api_request("POST", url, data)
 
 def api_put(url, data):
-    return requests.put(url, headers=github_headers(), json=data)
+    return api_request("PUT", url, data)
+
+def api_patch(url, data):
+    return api_request("PATCH", url, data)
 
 def create_github_repo():
     """Create the GitHub repository if it doesn't exist."""
     print(f"\n📦 Creating GitHub repository '{REPO_NAME}'...")
 
-    # Check if repo already exists
-    check = api_get(f"https://api.github.com/repos/{GITHUB_USERNAME}/{REPO_NAME}")
-    if check.status_code == 200:
-        print(f"   ✅ Repo already exists — will push to it")
-        return True
-
-    # Create repo
+    # Create repo — a 422 "already exists" means we just push to it
     resp = api_post("https://api.github.com/user/repos", {
         "name": REPO_NAME,
         "description": REPO_DESCRIPTION,
@@ -118,56 +192,159 @@ def create_github_repo():
         print(f"   ✅ Repo created: {data['html_url']}")
         time.sleep(2)  # Wait for GitHub to initialize
         return True
-    else:
-        print(f"   ❌ Failed to create repo: {resp.status_code} — {resp.text}")
-        return False
+    elif resp.status_code == 422 and "already exists" in resp.text:
+        print(f"   ✅ Repo already exists — will push to it")
+        return True
 
-def get_file_sha(path):
-    """Get the SHA of an existing file in the repo (needed for updates)."""
-    url = f"https://api.github.com/repos/{GITHUB_USERNAME}/{REPO_NAME}/contents/{path}"
-    resp = api_get(url)
-    if resp.status_code == 200:
-        return resp.json().get("sha")
-    return None
+    # Tokens without repo-creation rights (e.g. fine-grained, Contents only)
+    # can still push to an existing repo — check before giving up
+    check = api_get(f"https://api.github.com/repos/{GITHUB_USERNAME}/{REPO_NAME}")
+    if check.status_code == 200:
+        print(f"   ✅ Repo already exists — will push to it")
+        return True
 
-def push_file(file_path, repo_path, commit_message):
-    """Push a single file to GitHub via Contents API."""
-    url = f"https://api.github.com/repos/{GITHUB_USERNAME}/{REPO_NAME}/contents/{repo_path}"
+    print(f"   ❌ Failed to create repo: {resp.status_code} — {resp.text}")
+    return False
 
-    # Read and encode
-    with open(file_path, "rb") as f:
-        content = base64.b64encode(f.read()).decode("utf-8")
+def repo_api(path):
+    """Build a URL under the target repository's API root."""
+    return f"https://api.github.com/repos/{GITHUB_USERNAME}/{REPO_NAME}/{path}"
 
-    data = {
-        "message": commit_message,
-        "content": content,
+def init_branch():
+    """Give an empty repo its first commit (Git Data API can't write to one)."""
+    print(f"   📝 Branch '{BRANCH}' has no commits yet — initializing it...")
+    readme = f"# {REPO_NAME}\n\n{REPO_DESCRIPTION}\n".encode("utf-8")
+    resp = api_put(repo_api("contents/README.md"), {
+        "message": "Initial commit",
+        "content": base64.b64encode(readme).decode("ascii"),
         "branch": BRANCH,
-    }
+    })
+    if resp.status_code not in (200, 201):
+        raise RuntimeError(
+            f"Cannot initialize branch '{BRANCH}': {resp.status_code} — {resp.text}\n"
+            f"   Create '{BRANCH}' on GitHub (or set BRANCH to an existing one) and re-run."
+        )
+
+def create_branch():
+    """Create BRANCH in a non-empty repo, starting from the default branch's tip."""
+    repo = api_get(f"https://api.github.com/repos/{GITHUB_USERNAME}/{REPO_NAME}")
+    if repo.status_code != 200:
+        raise RuntimeError(f"Cannot read repo: {repo.status_code} — {repo.text}")
+    default = repo.json()["default_branch"]
+    print(f"   🌿 Branch '{BRANCH}' doesn't exist — creating it from '{default}'...")
+
+    ref = api_get(repo_api(f"git/ref/heads/{default}"))
+    if ref.status_code != 200:
+        raise RuntimeError(f"Cannot read branch '{default}': {ref.status_code} — {ref.text}")
+    resp = api_post(repo_api("git/refs"), {
+        "ref": f"refs/heads/{BRANCH}",
+        "sha": ref.json()["object"]["sha"],
+    })
+    if resp.status_code != 201:
+        raise RuntimeError(f"Cannot create branch '{BRANCH}': {resp.status_code} — {resp.text}")
+
+def get_head():
+    """Return (commit_sha, tree_sha) for the tip of BRANCH, creating it if needed."""
+    ref = api_get(repo_api(f"git/ref/heads/{BRANCH}"))
+    if ref.status_code in (404, 409):
+        if ref.status_code == 409:   # repo is empty — first commit creates BRANCH
+            init_branch()
+        else:                        # repo has commits, just not on BRANCH
+            create_branch()
+        ref = api_get(repo_api(f"git/ref/heads/{BRANCH}"))
+    if ref.status_code != 200:
+        raise RuntimeError(f"Cannot read branch '{BRANCH}': {ref.status_code} — {ref.text}")
+    head_sha = ref.json()["object"]["sha"]
+    commit = api_get(repo_api(f"git/commits/{head_sha}"))
+    if commit.status_code != 200:
+        raise RuntimeError(f"Cannot read commit {head_sha}: {commit.status_code} — {commit.text}")
+    return head_sha, commit.json()["tree"]["sha"]
+
+HASH_CHUNK = 64 * 1024
+
+def get_remote_blobs(tree_sha):
+    """Map path → blob SHA for every file in a remote tree (one request)."""
+    resp = api_get(repo_api(f"git/trees/{tree_sha}?recursive=1"))
+    if resp.status_code != 200:
+        return {}
+    return {e["path"]: e["sha"] for e in resp.json()["tree"] if e["type"] == "blob"}
+
+def git_blob_sha(file_path):
+    """Compute the git blob SHA of a local file, as git would store it."""
+    h = hashlib.sha1(f"blob {os.path.getsize(file_path)}\0".encode())
+    with open(file_path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK):
+            h.update(chunk)
+    return h.hexdigest()
 
-    # Check if file exists (for update vs create)
-    existing_sha = get_file_sha(repo_path)
-    if existing_sha:
-        data["sha"] = existing_sha
+B64_CHUNK = 57 * 1024   # multiple of 3, so chunks encode without padding
 
-    resp = api_put(url, data)
+def blob_body(file_path):
+    """Build the /git/blobs JSON body, base64-encoding the file chunk by chunk.
 
-    if resp.status_code in (200, 201):
-        return True
-    else:
-        print(f"   ⚠️  Failed to push {repo_path}: {resp.status_code}")
-        return False
+    Base64 output never needs JSON escaping, so the body is written directly
+    as bytes instead of going through the JSON encoder.
+    """
+    buf = io.BytesIO()
+    buf.write(b'{"content":"')
+    with open(file_path, "rb") as f:
+        while chunk := f.read(B64_CHUNK):
+            buf.write(base64.b64encode(chunk))
+    buf.write(b'","encoding":"base64"}')
+    return buf.getvalue()
+
+def push_file(file_path):
+    """Upload a single file as a git blob; returns (sha, status or error), sha None on failure."""
+    try:
+        resp = api_request("POST", repo_api("git/blobs"), body=blob_body(file_path))
+    except httpx.HTTPError as exc:
+        return None, repr(exc)
+    respect_rate_limit(resp)
+
+    if resp.status_code == 201:
+        return resp.json()["sha"], resp.status_code
+    return None, resp.status_code
+
+def commit_tree(tree, message, head_sha, base_tree_sha):
+    """Create a tree + commit on top of head_sha and move BRANCH to it."""
+    resp = api_post(repo_api("git/trees"), {
+        "base_tree": base_tree_sha,
+        "tree": tree,
+    })
+    if resp.status_code != 201:
+        raise RuntimeError(f"Failed to create tree: {resp.status_code} — {resp.text}")
+    tree_sha = resp.json()["sha"]
+
+    resp = api_post(repo_api("git/commits"), {
+        "message": message,
+        "tree": tree_sha,
+        "parents": [head_sha],
+    })
+    if resp.status_code != 201:
+        raise RuntimeError(f"Failed to create commit: {resp.status_code} — {resp.text}")
+    commit_sha = resp.json()["sha"]
+
+    resp = api_patch(repo_api(f"git/refs/heads/{BRANCH}"), {"sha": commit_sha})
+    if resp.status_code != 200:
+        raise RuntimeError(f"Failed to update '{BRANCH}': {resp.status_code} — {resp.text}")
+    return commit_sha
+
+SKIP_DIRS = {"node_modules", ".git", ".next"}
 
 def get_all_files(directory):
-    """Recursively list all files in a directory."""
+    """Recursively list all files in a directory, pruning SKIP_DIRS."""
     files = []
-    base = Path(directory)
-    for path in base.rglob("*"):
-        if path.is_file():
-            # Skip node_modules and .git
-            parts = path.parts
-            if "node_modules" in parts or ".git" in parts:
-                continue
-            files.append(path)
+
+    def walk(path):
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        walk(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    files.append(Path(entry.path))
+
+    walk(directory)
     return files
 
 def push_project(project_dir):
@@ -180,39 +357,61 @@ def push_project(project_dir):
     success = 0
     failed  = []
 
-    # First commit — README and key files
+    # README and key files go first in upload and progress order
     priority = ["README.md", "package.json", "index.html", "vite.config.ts"]
-
-    def sort_key(p):
-        rel = str(p.relative_to(project_dir))
-        for i, name in enumerate(priority):
-            if rel == name or rel.endswith(f"/{name}"):
-                return i
-        return len(priority)
-
-    all_files.sort(key=sort_key)
-
-    for i, path in enumerate(all_files):
-        rel_path = str(path.relative_to(project_dir)).replace("\\", "/")
-        commit_msg = f"feat: add {rel_path}" if i > 0 else "🐝 Initial BrowserWasp commit"
-
-        print(f"   [{i+1:3d}/{total}] {rel_path}", end=" ")
-
-        ok = push_file(str(path), rel_path, commit_msg)
-        if ok:
-            success += 1
-            print("✅")
-        else:
-            failed.append(rel_path)
-            print("❌")
-
-        # Rate limit — GitHub API allows ~5000 requests/hour
-        # Small delay every 10 files to be safe
-        if (i + 1) % 10 == 0:
-            time.sleep(0.5)
+    rank = {name: i for i, name in enumerate(priority)}
+
+    # Compute each relative path once, then stable-sort by the file name's rank
+    rels = [(p, str(p.relative_to(project_dir)).replace("\\", "/")) for p in all_files]
+    rels.sort(key=lambda pr: rank.get(pr[1].rsplit("/", 1)[-1], len(priority)))
+
+    head_sha, base_tree_sha = get_head()
+    tree = []
+
+    # Content addressing — skip files whose blob already sits in the remote tree
+    remote = get_remote_blobs(base_tree_sha)
+    pending = []
+    unchanged = 0
+    for path, rel_path in rels:
+        remote_sha = remote.get(rel_path)
+        if remote_sha is not None and remote_sha == git_blob_sha(path):
+            unchanged += 1
+            continue
+        pending.append((str(path), rel_path))
+    if unchanged:
+        print(f"   ⏭️  {unchanged} files unchanged — skipping\n")
+
+    # Blob uploads are independent — run them concurrently, commit serially
+    with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as ex:
+        results = ex.map(push_file, [file_path for file_path, _ in pending])
+
+        # One carriage-return status line — per-file prints flood Colab's IOPub
+        for i, ((_, rel_path), (blob_sha, status)) in enumerate(zip(pending, results)):
+            sys.stdout.write(f"\r   [{i+1:3d}/{len(pending)}] {rel_path[:60]:<60}")
+            if i % 16 == 0:
+                sys.stdout.flush()
+
+            if blob_sha:
+                tree.append({"path": rel_path, "mode": "100644", "type": "blob", "sha": blob_sha})
+                success += 1
+            else:
+                failed.append(f"{rel_path} ({status})")
+
+    if pending:
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+    if tree:
+        print(f"\n📝 Committing {len(tree)} files...")
+        commit_sha = commit_tree(tree, "🐝 Initial BrowserWasp commit", head_sha, base_tree_sha)
+        print(f"   ✅ {BRANCH} → {commit_sha[:7]}")
+    elif not failed:
+        print("\n✨ Everything is already up to date — nothing to commit.")
 
     print(f"\n{'='*50}")
     print(f"✅ Pushed: {success}/{total} files")
+    if unchanged:
+        print(f"⏭️  Unchanged: {unchanged} files")
     if failed:
         print(f"❌ Failed: {len(failed)} files")
         for f in failed:
@@ -276,14 +475,43 @@ def run():
     display(upload_btn, status_out)
 
 
+def extract_zip(zip_path, extract_dir):
+    """Extract a ZIP with one decompressing thread per CPU."""
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        members = zf.infolist()
+        # Create listed directories up front — zf.extract sanitizes the path
+        for m in members:
+            if m.is_dir():
+                zf.extract(m, extract_dir)
+
+    # ZipFile isn't safe to share across threads — each worker opens its own
+    local = threading.local()
+    handles = []
+
+    def extract(member):
+        if not hasattr(local, "zf"):
+            local.zf = zipfile.ZipFile(zip_path, "r")
+            handles.append(local.zf)
+        try:
+            local.zf.extract(member, extract_dir)
+        except FileExistsError:
+            # Another worker created the same unlisted parent directory first
+            local.zf.extract(member, extract_dir)
+
+    try:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+            list(ex.map(extract, [m for m in members if not m.is_dir()]))
+    finally:
+        for zf in handles:
+            zf.close()
+
 def process_zip(zip_path):
     """Extract ZIP and push to GitHub."""
     extract_dir = tempfile.mkdtemp(prefix="browserclaw_")
 
     try:
         print(f"\n📦 Extracting ZIP...")
-        with zipfile.ZipFile(zip_path, "r") as zf:
-            zf.extractall(extract_dir)
+        extract_zip(zip_path, extract_dir)
 
         # Find the actual project root (handle nested folders)
         entries = list(Path(extract_dir).iterdir())